@@ -434,7 +434,7 @@ class GDBClient:
             )
         ).contains_any(final_responses):
             for response in responses:
-                if response.response_type == GDBResponse.Type.CONSOLE:
+                if response.response_type is GDBResponse.Type.CONSOLE:
                     # Console responses are human-readable
                     self._logger.info(response.unescaped_payload().strip())
 
@@ -138,8 +138,8 @@ class GDBInterface:
                     message=response.get("message"),
                     payload=response.get("payload"),
                     token=response.get("token"),
-                    response_type=GDBResponse.Type(response.get("type")),
-                    stream=GDBResponse.Stream(response.get("stream")),
+                    response_type=GDBResponse.Type(response.get("type")),  # type: ignore
+                    stream=GDBResponse.Stream(response.get("stream")),  # type: ignore
                 )
                 for response in raw_responses
             ],
@@ -353,10 +353,10 @@ class GDBInterface:
             return
 
         for response in responses:
-            log_message: str = f"[Response <{response.response_type.value}>]:"
-            if response.response_type == GDBResponse.Type.NOTIFY:
+            log_message: str = f"[Response <{response.response_type!s}>]:"
+            if response.response_type is GDBResponse.Type.NOTIFY:
                 log_message += f" {response.message} -> {response.unescaped_payload().strip()}"
-            elif response.response_type == GDBResponse.Type.RESULT:
+            elif response.response_type is GDBResponse.Type.RESULT:
                 log_message += f" {response.message}"
                 if response.payload_is_json():
                     additional_message = response.payload_json().get(
@@ -3,12 +3,44 @@ it's parsed by `GDBInterface` to proper, strongly typed objects from this module
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Union
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Iterator
+    from collections.abc import Hashable, Iterable, Iterator
+
+ESCAPE_SEQUENCE_PATTERN = re.compile(r'\\[nt"]')
+"""Pattern matching escape sequences that are unescaped in GDB payloads"""
+ESCAPE_SEQUENCES = {"\\n": "\n", "\\t": "\t", '\\"': '"'}
+"""Mapping of escape sequences to unescaped characters"""
+UNESCAPED_PAYLOADS_CACHE_SIZE = 1024
+"""Maximum amount of unescaped payload strings kept in cache. GDB tends to repeat the same
+payloads (for example, when the same responses are logged and stringified multiple times),
+so there's no need to unescape them every time."""
+
+
+@lru_cache(maxsize=UNESCAPED_PAYLOADS_CACHE_SIZE)
+def _unescape_payload_string(payload: str) -> str:
+    """Returns unescaped version of payload string. Results are memoized."""
+    # Single pass over the string, instead of a `replace` call for each escape sequence.
+    return ESCAPE_SEQUENCE_PATTERN.sub(lambda match: ESCAPE_SEQUENCES[match.group(0)], payload)
+
+
+_NOT_COMPUTED = object()
+"""Marker of cached value that hasn't been computed yet"""
+
+
+def _canonical_form(value: object) -> Hashable:
+    """Converts a payload (or any of it's values) into hashable, canonical form.
+    Dicts are converted into frozen sets of their items, and lists into tuples."""
+    if isinstance(value, dict):
+        return frozenset((key, _canonical_form(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(_canonical_form(item) for item in value)
+    return value
 
 
 @dataclass
@@ -29,7 +61,21 @@ class ProgramSymbol:
 
 @dataclass
 class GDBResponse:
-    """Structure representing GDB response."""
+    """Structure representing GDB response.
+
+    Payload can be replaced, but it shouldn't be modified in-place, as cached data used for
+    comparison (see `is_similar`) won't be updated in that case."""
+
+    # Python 3.9 doesn't support `@dataclass(slots=True)`, so slots must be declared manually.
+    __slots__ = (
+        "message",
+        "payload",
+        "token",
+        "response_type",
+        "stream",
+        "_cached_payload_source",
+        "_cached_payload_key",
+    )
 
     Payload = Union[dict[str, Any], list[Any], str]
 
@@ -44,36 +90,80 @@ class GDBResponse:
     """Response's stream, always present in GDB responses, but left as `Optional` to allow creating
     GDBResponses for comparison."""
 
-    class Type(Enum):
-        """Response type"""
+    class Type(IntEnum):
+        """Response type. Integer-valued, so comparing types is cheap.
+        Can also be created from it's GDB/MI name, for example `GDBResponse.Type("result")`.
+
+        Note that, as this is an `IntEnum`, its members compare equal to plain integers and to
+        members of `GDBResponse.Stream` (for example, `Type.RESULT == Stream.STDOUT`).
+        Compare types using `is` to avoid that."""
+
+        RESULT = 0
+        NOTIFY = 1
+        CONSOLE = 2
+        LOG = 3
+        OUTPUT = 4
+        TARGET = 5
+        DONE = 6
 
-        RESULT = "result"
-        NOTIFY = "notify"
-        CONSOLE = "console"
-        LOG = "log"
-        OUTPUT = "output"
-        TARGET = "target"
-        DONE = "done"
+        @classmethod
+        def _missing_(cls: type[GDBResponse.Type], value: object) -> GDBResponse.Type | None:
+            """Returns response type with GDB/MI name specified as value, for example `result`.
+            Called by `Enum` when value is not one of the integers."""
+            return _RESPONSE_TYPES_BY_NAME.get(value) if isinstance(value, str) else None
 
         def __str__(self: GDBResponse.Type) -> str:
-            return self.value
+            return self.name.lower()
 
         def __repr__(self: GDBResponse.Type) -> str:
             return str(self)
 
-    class Stream(Enum):
-        """Stream type"""
+        def __format__(self: GDBResponse.Type, format_spec: str) -> str:
+            return str(self).__format__(format_spec)
+
+    class Stream(IntEnum):
+        """Stream type. Integer-valued, so comparing streams is cheap.
+        Can also be created from it's GDB/MI name, for example `GDBResponse.Stream("stdout")`.
+
+        Same as with `GDBResponse.Type`, compare streams using `is`, as `==` also considers
+        plain integers and `GDBResponse.Type` members equal to streams."""
 
-        STDOUT = "stdout"
-        STDIN = "stdin"
-        STDERR = "stderr"
+        STDOUT = 0
+        STDIN = 1
+        STDERR = 2
+
+        @classmethod
+        def _missing_(cls: type[GDBResponse.Stream], value: object) -> GDBResponse.Stream | None:
+            """Returns stream with GDB/MI name specified as value, for example `stdout`.
+            Called by `Enum` when value is not one of the integers."""
+            return _RESPONSE_STREAMS_BY_NAME.get(value) if isinstance(value, str) else None
 
         def __str__(self: GDBResponse.Stream) -> str:
-            return self.value
+            return self.name.lower()
 
         def __repr__(self: GDBResponse.Stream) -> str:
             return str(self)
 
+        def __format__(self: GDBResponse.Stream, format_spec: str) -> str:
+            return str(self).__format__(format_spec)
+
+    def __post_init__(self: GDBResponse) -> None:
+        # Canonical form of the payload and it's hash are used for fast similarity checks.
+        # Most responses are never compared, so both are computed lazily. Payload they were
+        # computed from is stored too, so they can be recomputed if payload is replaced.
+        self._cached_payload_source: object = _NOT_COMPUTED
+        self._cached_payload_key: tuple[int, Hashable] = (0, None)
+
+    @property
+    def _payload_key(self: GDBResponse) -> tuple[int, Hashable]:
+        """Returns a tuple of canonical payload's hash, and canonical payload itself.
+        Computed on first access, and recomputed only if payload is replaced."""
+        if self._cached_payload_source is not self.payload:
+            canonical_payload = _canonical_form(self.payload)
+            self._cached_payload_source = self.payload
+            self._cached_payload_key = (hash(canonical_payload), canonical_payload)
+        return self._cached_payload_key
+
     def is_similar(self: GDBResponse, other: GDBResponse) -> bool:
         """Checks if another response is 'similar' to current one.
         Similarity criteria are:
@@ -84,16 +174,20 @@ class GDBResponse:
 
         In other words, type must be equal, and message/payload must be equal if set in `other`.
         """
-        if self.response_type != other.response_type:
+        if self.response_type is not other.response_type:
             return False
 
         if other.message is not None and self.message != other.message:
             return False
 
-        if other.payload is not None and self.payload != other.payload:
-            return False
+        if other.payload is None:
+            return True
 
-        return True
+        # Same as `self.payload == other.payload`, but on cached canonical forms.
+        # Hashes are compared first, so different payloads are usually rejected without deep
+        # comparison.
+        # pylint: disable=protected-access
+        return self._payload_key == other._payload_key  # noqa: SLF001
 
     def is_any_similar(self: GDBResponse, responses: Iterable[GDBResponse]) -> bool:
         """Checks if any of the provided responses is similar to current one"""
@@ -102,7 +196,11 @@ class GDBResponse:
     def unescaped_payload(self: GDBResponse) -> str:
         """Returns unescaped version of payload string.
         Currently fixes newlines, tabs and `"`"""
-        return str(self.payload).replace("\\n", "\n").replace("\\t", "\t").replace('\\"', '"')
+        payload = str(self.payload)
+        # Most payloads contain no escape sequences at all, so don't bother with them.
+        if "\\" not in payload:
+            return payload
+        return _unescape_payload_string(payload)
 
     def payload_is_json(self: GDBResponse) -> bool:
         """Returns `True` if payload is a JSON object, `False` otherwise"""
@@ -141,6 +239,12 @@ class GDBResponse:
         )
 
 
+_RESPONSE_TYPES_BY_NAME = {str(response_type): response_type for response_type in GDBResponse.Type}
+"""Mapping of GDB/MI response type names to `GDBResponse.Type`, used by `Type._missing_`"""
+_RESPONSE_STREAMS_BY_NAME = {str(stream): stream for stream in GDBResponse.Stream}
+"""Mapping of GDB/MI stream names to `GDBResponse.Stream`, used by `Stream._missing_`"""
+
+
 class GDBResponsesList:
     """Class representing a list of GDB responses.
 
@@ -149,15 +253,31 @@ class GDBResponsesList:
     or concatenating the console messages into singular string.
     """
 
+    __slots__ = ("_items", "_by_type")
+
     def __init__(self: GDBResponsesList, responses: list[GDBResponse]) -> None:
-        """Initializes the list with responses received from GDB"""
-        self._items = responses
+        """Initializes the list with responses received from GDB.
+        Responses are copied, so modifying the passed list doesn't affect this one."""
+        self._items = list(responses)
+        self._by_type: dict[GDBResponse.Type, list[GDBResponse]] | None = None
+
+    @property
+    def _index(self: GDBResponsesList) -> dict[GDBResponse.Type, list[GDBResponse]]:
+        """Returns responses grouped by their type. Grouping is performed lazily on first access,
+        and cached until the list is modified."""
+        if self._by_type is None:
+            index: dict[GDBResponse.Type, list[GDBResponse]] = {
+                response_type: [] for response_type in GDBResponse.Type
+            }
+            for response in self._items:
+                index[response.response_type].append(response)
+            self._by_type = index
+        return self._by_type
 
     def of_type(self: GDBResponsesList, response_type: GDBResponse.Type) -> GDBResponsesList:
         """Return all the responses on the list that have specified type"""
-        return GDBResponsesList(
-            list(filter(lambda response: response.response_type == response_type, self)),
-        )
+        # Copy the bucket, so modifying returned list won't corrupt the cached index.
+        return GDBResponsesList(self._index[response_type])
 
     def results(self: GDBResponsesList) -> GDBResponsesList:
         """Returns a list containing only `result`-type messages"""
@@ -191,8 +311,8 @@ class GDBResponsesList:
                        produce human-readable string.
         """
         if unescape:
-            return [response.unescaped_payload() for response in self]
-        return [str(response.payload) for response in self]
+            return [response.unescaped_payload() for response in self._items]
+        return [str(response.payload) for response in self._items]
 
     def payload_string(self: GDBResponsesList, separator: str = "", unescape: bool = True) -> str:
         """Returns a single stringified payload from all responses. Returned string is stripped
@@ -203,13 +323,18 @@ class GDBResponsesList:
         * `escape` [bool] - If `True`, escaped characters in payloads will be unescaped to
                             produce human-readable string.
         """
-        return separator.join(self.payload_string_list(unescape)).strip()
+        payloads = (
+            response.unescaped_payload() if unescape else str(response.payload)
+            for response in self._items
+        )
+        return separator.join(payloads).strip()
 
     def extend(self: GDBResponsesList, other: GDBResponsesList) -> None:
         """Adds items from different response list to current one."""
         # This uses another instance of itself, so protected access should be allowed.
         # pylint: disable=protected-access
         self._items.extend(other._items)  # noqa: SLF001
+        self._by_type = None
 
     def contains_any(self: GDBResponsesList, responses: Iterable[GDBResponse]) -> bool:
         """Returns `True` if any of the provided responses is on the list. `False` otherwise.
@@ -246,7 +371,10 @@ class GDBResponsesList:
     def __contains__(self: GDBResponsesList, expected: GDBResponse) -> bool:
         """Returns `True` if any response on the list is similar to provided one.
         To see how the items are compared, see `GDBResponse.is_similar()`."""
-        return any(response.is_similar(expected) for response in self)
+        # Similar responses must have the same type, so there's no need to check other ones.
+        return any(
+            response.is_similar(expected) for response in self._index[expected.response_type]
+        )
 
     def __len__(self: GDBResponsesList) -> int:
         """Returns amount of elements on the list"""
@@ -261,7 +389,7 @@ class GDBResponsesList:
         return self._items.__iter__()
 
     def __str__(self: GDBResponsesList) -> str:
-        return "\n".join([f"[{i}] {response}" for i, response in enumerate(self)])
+        return "\n".join(f"[{i}] {response}" for i, response in enumerate(self._items))
 
     def __repr__(self: GDBResponsesList) -> str:
         return str(self)
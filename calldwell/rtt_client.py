@@ -72,12 +72,23 @@ class CalldwellRTTClient(RTTClient):
 
     def receive_bytes_stream(self: CalldwellRTTClient) -> bytes:
         """Receives data via Calldwell stream from RTT target"""
-        stream_data = self._extract_stream_data_from_recv_buffer()
-        while stream_data is None:
+        return self.receive_bytes_streams(1)[0]
+
+    def receive_bytes_streams(self: CalldwellRTTClient, max_count: int) -> list[bytes]:
+        """Receives data from multiple Calldwell streams from RTT target.
+        Blocks until at least one stream is received, and then returns all the streams that are
+        already available (but no more than `max_count`).
+        Raises `ValueError` if `max_count` is not positive."""
+        if max_count <= 0:
+            msg = f"Maximum amount of received streams must be positive (got {max_count})"
+            raise ValueError(msg)
+
+        streams_data = self._extract_streams_data_from_recv_buffer(max_count)
+        while len(streams_data) == 0:
             self._receive()
-            stream_data = self._extract_stream_data_from_recv_buffer()
+            streams_data = self._extract_streams_data_from_recv_buffer(max_count)
 
-        return stream_data
+        return streams_data
 
     def transmit_bytes_stream(self: CalldwellRTTClient, data: bytes) -> None:
         """Transmits data via Calldwell stream to RTT target"""
@@ -89,32 +100,46 @@ class CalldwellRTTClient(RTTClient):
         """Receives an UTF-8 string via Calldwell stream from RTT target"""
         return self.receive_bytes_stream().decode("utf-8")
 
+    def receive_string_streams(self: CalldwellRTTClient, max_count: int) -> list[str]:
+        """Receives UTF-8 strings from multiple Calldwell streams from RTT target.
+        See `receive_bytes_streams` for details."""
+        return [stream.decode("utf-8") for stream in self.receive_bytes_streams(max_count)]
+
     def transmit_string_stream(self: CalldwellRTTClient, message: str) -> None:
         """Transmits an UTF-8 string via Calldwell stream to RTT target"""
         self.transmit_bytes_stream(message.encode("utf-8"))
 
-    def _extract_stream_data_from_recv_buffer(self: CalldwellRTTClient) -> bytes | None:
-        """Looks for valid Calldwell stream in reception buffer, and returns it's data if found"""
-        start_marker_index = self._data_buffer.find(CalldwellRTTClient.StreamMarker.START)
-        if start_marker_index == -1:
-            return None
-
-        end_marker_index = self._data_buffer.find(
-            CalldwellRTTClient.StreamMarker.END,
-            start_marker_index,
-        )
-        if end_marker_index == -1:
-            return None
-
-        stream_data = self._data_buffer[start_marker_index + 1 : end_marker_index]
-
-        # Remove everything up to end marker from the buffer
-        if end_marker_index != len(self._data_buffer):
-            self._data_buffer = self._data_buffer[end_marker_index + 1 :]
-        else:
-            self._data_buffer.clear()
-
-        return bytes(stream_data)
+    def _extract_streams_data_from_recv_buffer(
+        self: CalldwellRTTClient,
+        max_count: int,
+    ) -> list[bytes]:
+        """Looks for valid Calldwell streams in reception buffer, and returns their data.
+        Returns at most `max_count` streams, or an empty list if there are none."""
+        streams_data: list[bytes] = []
+        search_start_index = 0
+
+        while len(streams_data) < max_count:
+            start_marker_index = self._data_buffer.find(
+                CalldwellRTTClient.StreamMarker.START,
+                search_start_index,
+            )
+            if start_marker_index == -1:
+                break
+
+            end_marker_index = self._data_buffer.find(
+                CalldwellRTTClient.StreamMarker.END,
+                start_marker_index,
+            )
+            if end_marker_index == -1:
+                break
+
+            streams_data.append(bytes(self._data_buffer[start_marker_index + 1 : end_marker_index]))
+            search_start_index = end_marker_index + 1
+
+        # Remove everything up to last extracted end marker from the buffer, all at once
+        del self._data_buffer[:search_start_index]
+
+        return streams_data
 
     def _transmit_stream_marker(self: CalldwellRTTClient, marker: StreamMarker) -> None:
         # byteorder doesn't matter, but mypy asks for it
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import logging
 import shutil
 import subprocess
@@ -35,6 +36,11 @@ HOST_HANDSHAKE_MESSAGE = "host handshake requested"
 EXPECTED_MCU_HANDSHAKE_MESSAGE = f"{len(HOST_HANDSHAKE_MESSAGE)}:{HOST_HANDSHAKE_MESSAGE}"
 """Expected MCU response to handshake request"""
 
+# Handshake is performed at bytes level, so encode the messages only once.
+_EXPECTED_MCU_INIT_BYTES = EXPECTED_MCU_INIT_MESSAGE.encode("utf-8")
+_HOST_HANDSHAKE_BYTES = HOST_HANDSHAKE_MESSAGE.encode("utf-8")
+_EXPECTED_MCU_HANDSHAKE_BYTES = EXPECTED_MCU_HANDSHAKE_MESSAGE.encode("utf-8")
+
 
 # Yes, this is a very big function, but it's supposed to be all-in-one single-liner.
 # pylint: disable=too-many-arguments,too-many-locals,too-complex
@@ -106,12 +112,13 @@ def init_remote_calldwell_rs_session(  # noqa: PLR0913,C901
 
     def try_initializing_session() -> tuple[GDBClient, SSHClient] | None:
         upload_try = 0
+        session_restarts = 0
         remote_gdb_full_hostname = f"{debug_host_network_path}:{gdb_server_port}"
 
         while upload_try < max_upload_tries:
             logging.info(
-                "Establishing session and uploading the binary, try "
-                f"{upload_try + 1}/{max_upload_tries}",
+                f"Establishing session, try {upload_try + 1}/{max_upload_tries} "
+                f"(restarts so far: {session_restarts})",
             )
 
             ssh = SSHClient(debug_host_network_path, debug_host_login, debug_host_password)
@@ -124,29 +131,41 @@ def init_remote_calldwell_rs_session(  # noqa: PLR0913,C901
                 log_execution=log_execution,
             )
 
-            if not gdb.connect_to_remote(remote_gdb_full_hostname):
-                logging.error(
-                    f"Could not connect to remote GDB server @ {remote_gdb_full_hostname}",
-                )
-                return None
-
-            session_established = False
-
             try:
-                if gdb.load_executable(path_to_test_executable):
-                    session_established = True
-                else:
-                    logging.warning(
-                        f"Loading executable {path_to_test_executable} failed. Restarting session",
+                if not gdb.connect_to_remote(remote_gdb_full_hostname):
+                    logging.error(
+                        f"Could not connect to remote GDB server @ {remote_gdb_full_hostname}",
                     )
+                    return None
             except GdbTimeoutError:
-                logging.warning("Received GdbTimeoutError, restarting session")
-
-            if session_established:
-                logging.info(f"Session established on try # {upload_try + 1}!")
-                return gdb, ssh
-
-            upload_try += 1
+                # Count that as a failed try, otherwise we could end up in infinite loop.
+                upload_try += 1
+                logging.warning(
+                    "Connecting to remote GDB server timed out on try "
+                    f"{upload_try}/{max_upload_tries}, restarting session",
+                )
+            else:
+                # Setting up the session is expensive, so retry flashing within the same session
+                # for as long as GDB keeps responding. Timeouts usually indicate broken GDB server
+                # connection, and the only known fix for that is restarting the session.
+                while upload_try < max_upload_tries:
+                    upload_try += 1
+                    logging.info(f"Uploading the binary, try {upload_try}/{max_upload_tries}")
+
+                    try:
+                        if gdb.load_executable(path_to_test_executable):
+                            logging.info(f"Session established on try # {upload_try}!")
+                            return gdb, ssh
+                    except GdbTimeoutError:
+                        logging.warning("Received GdbTimeoutError, restarting session")
+                        break
+
+                    if upload_try < max_upload_tries:
+                        logging.warning(
+                            f"Loading executable {path_to_test_executable} failed. Retrying upload",
+                        )
+
+            session_restarts += 1
             ssh.close()
             logging.info("Session closed.")
 
@@ -198,7 +217,7 @@ def build_cargo_app(
                         will be produced instead.
     """
 
-    if (cargo := shutil.which("cargo")) is None:
+    if (cargo := _find_cargo()) is None:
         logging.error("Error: Cargo executable not found!")
         return None
 
@@ -218,25 +237,34 @@ def build_cargo_app(
     return project_path / "target" / target_triple / build_type / exec_name
 
 
+@functools.lru_cache(maxsize=1)
+def _find_cargo() -> str | None:
+    """Returns path to Cargo executable, or `None` if it cannot be found.
+    Result is cached, call `_find_cargo.cache_clear()` if `PATH` changes."""
+    return shutil.which("cargo")
+
+
 def perform_calldwell_rs_handshake(rtt: CalldwellRTTClient) -> bool:
     """Performs Calldwell handshake after it's RTT facilities are started.
     This acts like a mini self-test of RTT communication, to guarantee that it works correctly.
     """
     logging.info("Performing Calldwell handshake")
 
-    if (init_message := rtt.receive_string_stream()) != EXPECTED_MCU_INIT_MESSAGE:
+    if (init_message := rtt.receive_bytes_stream()) != _EXPECTED_MCU_INIT_BYTES:
         logging.error(
             "Received unexpected MCU init message "
-            f"(got '{init_message}', expected '{EXPECTED_MCU_INIT_MESSAGE}')",
+            f"(got '{init_message.decode('utf-8', errors='replace')}', "
+            f"expected '{EXPECTED_MCU_INIT_MESSAGE}')",
         )
         return False
 
-    rtt.transmit_string_stream(HOST_HANDSHAKE_MESSAGE)
+    rtt.transmit_bytes_stream(_HOST_HANDSHAKE_BYTES)
 
-    if (response := rtt.receive_string_stream()) != EXPECTED_MCU_HANDSHAKE_MESSAGE:
+    if (response := rtt.receive_bytes_stream()) != _EXPECTED_MCU_HANDSHAKE_BYTES:
         logging.error(
             "MCU responded with invalid handshake message "
-            f"(got '{response}', expected '{EXPECTED_MCU_HANDSHAKE_MESSAGE}')",
+            f"(got '{response.decode('utf-8', errors='replace')}', "
+            f"expected '{EXPECTED_MCU_HANDSHAKE_MESSAGE}')",
         )
         return False
 
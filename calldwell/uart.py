@@ -252,40 +252,68 @@ class RemoteUARTConnection:
         Returns `Err(UARTError)` on invalid arguments or timeout.
         May throw an exception if received string (decoded after receiving all the bytes) is not a
         valid UTF-8 string."""
+        read_result = self.read_strings(terminator, 1, timeout_seconds, maximum_length)
+        if read_result.is_err:
+            return Err(read_result.unwrap_err())
+        return Ok(read_result.unwrap()[0])
+
+    def read_strings(
+        self: RemoteUARTConnection,
+        terminator: bytes,
+        count: int,
+        timeout_seconds: float = 3.0,
+        maximum_length: int = DEFAULT_CHUNK_SIZE,
+    ) -> Result[list[str], UARTError]:
+        """Reads specified amount of strings, each terminated by specified byte(s).
+        Works like calling `read_string` multiple times, but all the strings are taken out of
+        the buffer at once, after all of them have been received.
+        Returns `Err(UARTError)` on invalid arguments or timeout. In that case, received data
+        stays in RX buffer.
+        May throw an exception if any of received strings is not a valid UTF-8 string."""
+        if count <= 0:
+            return Err(UARTError.INVALID_LENGTH)
+
         # Similarly to `read_bytes`, fetch any data that's immediately available into internal
         # buffer, and return if it fails (timeout is silenced in non-blocking function).
         buffer_read_result = self._read_bytes_to_internal_buffer_non_blocking(maximum_length)
         if buffer_read_result.is_err:
             return Err(buffer_read_result.unwrap_err())
 
-        if (terminator_index := self._rx_buffer.find(terminator)) >= 0:
-            return Ok(
-                self._take_bytes_out_of_rx_buffer(terminator_index + len(terminator)).decode(
-                    "UTF-8",
-                ),
-            )
-
-        # If a valid string isn't yet available in the buffer, try to read it again, but in
-        # blocking mode. Repeat until timeout is hit to make sure that data in chunks is
-        # received correctly.
-
-        while (
-            buffer_read_result := self._read_bytes_to_internal_buffer(
+        # Look for terminators only in the data after the last found one, so the buffer isn't
+        # rescanned from the beginning every time a new chunk of data is received.
+        # End indices of found strings (including terminators) are stored, so they can be sliced
+        # out later without searching for terminators again.
+        strings_end_indices: list[int] = []
+        strings_end_index = 0
+        while True:
+            while (
+                len(strings_end_indices) < count
+                and (terminator_index := self._rx_buffer.find(terminator, strings_end_index)) >= 0
+            ):
+                strings_end_index = terminator_index + len(terminator)
+                strings_end_indices.append(strings_end_index)
+
+            if len(strings_end_indices) == count:
+                break
+
+            # If not all the strings are available in the buffer yet, read more data in blocking
+            # mode. On error (usually timeout), received data will stay in RX buffer until it's
+            # taken via `read_bytes` or some other function.
+            buffer_read_result = self._read_bytes_to_internal_buffer(
                 timeout_seconds,
                 maximum_length,
             )
-        ).is_ok:
-            if (terminator_index := self._rx_buffer.find(terminator)) >= 0:
-                return Ok(
-                    self._take_bytes_out_of_rx_buffer(terminator_index + len(terminator)).decode(
-                        "UTF-8",
-                    ),
-                )
-
-        # If `read_result` is not an integer, then it's an error which should be propagated.
-        # Received data will stay in RX buffer until it's taken via `read_bytes` or some other
-        # function.
-        return Err(buffer_read_result.unwrap_err())
+            if buffer_read_result.is_err:
+                return Err(buffer_read_result.unwrap_err())
+
+        received_data = self._take_bytes_out_of_rx_buffer(strings_end_index)
+        strings_start_indices = [0, *strings_end_indices[:-1]]
+        return Ok(
+            [
+                received_data[start_index:end_index].decode("UTF-8")
+                for start_index, end_index in zip(strings_start_indices, strings_end_indices)
+            ],
+        )
 
     def _take_bytes_out_of_rx_buffer(self: RemoteUARTConnection, amount: int) -> bytes:
         extracted_bytes = self._rx_buffer[0:amount]
@@ -83,17 +83,22 @@ def wait_for_messages(
     the test with non-zero exit code if an invalid message is received, indicating
     test failure.
     """
-    for message in expected_messages:
-        logging.info(f"Expecting '{message}'")
-        received_message = rtt.receive_string_stream()
-        logging.info(f"Received '{received_message}'")
-        if received_message != message:
-            logging.critical(
-                "TEST FAILED: UNEXPECTED MESSAGE RECEIVED "
-                f"(expected '{message}', got '{received_message}')",
-            )
-            finish_test(ssh)
-            sys.exit(2)
+    checked_messages_count = 0
+    while checked_messages_count < len(expected_messages):
+        # Fetch all the messages that are already available, instead of one-by-one.
+        remaining_messages = expected_messages[checked_messages_count:]
+        logging.info(f"Expecting '{remaining_messages[0]}'")
+        received_messages = rtt.receive_string_streams(len(remaining_messages))
+        for message, received_message in zip(remaining_messages, received_messages):
+            logging.info(f"Received '{received_message}'")
+            if received_message != message:
+                logging.critical(
+                    "TEST FAILED: UNEXPECTED MESSAGE RECEIVED "
+                    f"(expected '{message}', got '{received_message}')",
+                )
+                finish_test(ssh)
+                sys.exit(2)
+        checked_messages_count += len(received_messages)
 
 
 def wait_for_uart_messages(